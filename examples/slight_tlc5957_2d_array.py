@@ -37,13 +37,11 @@ spi_clock = digitalio.DigitalInOut(board.SCK)
 spi_clock.direction = digitalio.Direction.OUTPUT
 spi_mosi = digitalio.DigitalInOut(board.MOSI)
 spi_mosi.direction = digitalio.Direction.OUTPUT
-spi_miso = digitalio.DigitalInOut(board.MISO)
-spi_miso.direction = digitalio.Direction.INPUT
 
 # print((42 * '*') + "\n" + "init busio.SPI")
-# spi = busio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+# spi = busio.SPI(board.SCK, MOSI=board.MOSI)
 print("init bitbangio.SPI")
-spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI)
 
 # maximum frequency is currently hardcoded to 6MHz
 # https://github.com/adafruit/circuitpython/blob/master/ports/atmel-samd/common-hal/pulseio/PWMOut.c#L119
@@ -67,7 +65,6 @@ pixels = slight_tlc5957.TLC5957(
     gsclk=gsclk,
     spi_clock=spi_clock,
     spi_mosi=spi_mosi,
-    spi_miso=spi_miso,
     pixel_count=num_leds)
 
 print("pixel_count", pixels.pixel_count)
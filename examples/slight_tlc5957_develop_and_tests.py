@@ -21,6 +21,10 @@ import pulseio
 
 import slight_tlc5957
 
+# print timing information in the main loop.
+# the USB serial output is slow - set to False for the full frame rate.
+DEBUG = True
+
 ##########################################
 print(
     "\n" +
@@ -37,13 +41,14 @@ spi_clock = digitalio.DigitalInOut(board.SCK)
 spi_clock.direction = digitalio.Direction.OUTPUT
 spi_mosi = digitalio.DigitalInOut(board.MOSI)
 spi_mosi.direction = digitalio.Direction.OUTPUT
-spi_miso = digitalio.DigitalInOut(board.MISO)
-spi_miso.direction = digitalio.Direction.INPUT
 
 # print((42 * '*') + "\n" + "init busio.SPI")
-# spi = busio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+# spi = busio.SPI(board.SCK, MOSI=board.MOSI)
+# busio.SPI would be about 10x faster -
+# but it claims the SCK & MOSI pins and so the library can not use them
+# to bit-bang the function commands (latch pulse inside the last bits).
 print("init bitbangio.SPI")
-spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI)
 
 # maximum frequency is currently hardcoded to 6MHz
 # https://github.com/adafruit/circuitpython/blob/master/ports/atmel-samd/common-hal/pulseio/PWMOut.c#L119
@@ -66,7 +71,6 @@ pixels = slight_tlc5957.TLC5957(
     gsclk=gsclk,
     spi_clock=spi_clock,
     spi_mosi=spi_mosi,
-    spi_miso=spi_miso,
     pixel_count=num_leds)
 
 print("pixel_count", pixels.pixel_count)
@@ -88,11 +92,10 @@ pixels.update_fc()
 ##########################################
 def set_some_colors():
     """Set some colors."""
-    for index in range(num_leds):
-        # pixels[index] = (0.1, 0.1, 0.1)
-        # float 0.00002 → int 00001
-        pixels[index] = (0.0, 0.0, 0.00002)
-        # pixels[index] = (1, 1, 1)
+    # pixels.set_pixel_all((0.1, 0.1, 0.1))
+    # float 0.00002 → int 00001
+    pixels.set_pixel_all((0.0, 0.0, 0.00002))
+    # pixels.set_pixel_all_16bit_value(1, 1, 1)
     # pixels[0] = (1, 0, 0)
     # pixels[1] = (0, 0.1, 0)
     # pixels[2] = (0, 0, 1)
@@ -132,23 +135,6 @@ def time_meassurement():
         )
     )
 
-    duration = 0
-    for _index in range(loop_count):
-        start_time = time.monotonic()
-        pixels.show()
-        end_time = time.monotonic()
-        duration += end_time - start_time
-    print(
-        "'pixels.show()'"
-        "duration: {}s for {} loops.\n"
-        "\t{:.2f}ms per loop"
-        "".format(
-            duration,
-            loop_count,
-            (duration/loop_count)*1000
-        )
-    )
-
 
 ##########################################
 def main_loop():
@@ -157,29 +143,31 @@ def main_loop():
     # pylint does not know about time.monotonic()
 
     # color = (0.0, 0.0, 0.00002)
-    color = (0, 0, 1)
+    # only blue is faded - keep it as plain 16bit integer.
+    # no tuple per frame and no float detection needed.
+    value_blue = 1
     last_time = time.monotonic()
     loop_count = 0
     while True:
         loop_count += 1
-        color = (0, 0, color[2] + 500)
-        if color[2] > 65535:
-            duration = time.monotonic() - last_time
-            print(
-                "duration: {}s for {} loops.\n"
-                "\t{:.2f}ms per loop"
-                "".format(
-                    duration,
-                    loop_count,
-                    (duration/loop_count)*1000
+        value_blue += 500
+        if value_blue > 65535:
+            if DEBUG:
+                duration = time.monotonic() - last_time
+                print(
+                    "duration: {}s for {} loops.\n"
+                    "\t{:.2f}ms per loop"
+                    "".format(
+                        duration,
+                        loop_count,
+                        (duration/loop_count)*1000
+                    )
                 )
-            )
             # reset
-            color = (0, 0, 0)
+            value_blue = 0
             last_time = time.monotonic()
             loop_count = 0
-        for index in range(num_leds):
-            pixels[index] = color
+        pixels.set_pixel_all_16bit_value(0, 0, value_blue)
         # write data to chips
         pixels.show()
     #     # wait a second
@@ -36,13 +36,11 @@ spi_clock = digitalio.DigitalInOut(board.SCK)
 spi_clock.direction = digitalio.Direction.OUTPUT
 spi_mosi = digitalio.DigitalInOut(board.MOSI)
 spi_mosi.direction = digitalio.Direction.OUTPUT
-spi_miso = digitalio.DigitalInOut(board.MISO)
-spi_miso.direction = digitalio.Direction.INPUT
 
 # print((42 * '*') + "\n" + "init busio.SPI")
-# spi = busio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+# spi = busio.SPI(board.SCK, MOSI=board.MOSI)
 print("init bitbangio.SPI")
-spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI)
 
 # maximum frequency is currently hardcoded to 6MHz
 # https://github.com/adafruit/circuitpython/blob/master/ports/atmel-samd/common-hal/pulseio/PWMOut.c#L119
@@ -64,7 +62,6 @@ pixels = slight_tlc5957.TLC5957(
     gsclk=gsclk,
     spi_clock=spi_clock,
     spi_mosi=spi_mosi,
-    spi_miso=spi_miso,
     pixel_count=num_leds)
 
 print("pixel_count", pixels.pixel_count)
@@ -98,25 +95,49 @@ palette = [
 # Positional offset into color palette to get it to 'spin'
 offset = 0
 
+##########################################
+# lookup tables
+# palette_lookup & gamma_adjust are pure float python -
+# so we calculate them only once for LUT_SIZE positions.
+# every entry is already converted to a 16bit R, G, B tuple.
+LUT_SIZE = 256
+
+
+def create_lut(brightness):
+    """Create 16bit color lookup table for palette with brightness."""
+    lut = []
+    for lut_index in range(LUT_SIZE):
+        color = fancyled.palette_lookup(palette, lut_index / LUT_SIZE)
+        color = fancyled.gamma_adjust(color, brightness=brightness)
+        lut.append((
+            int(color.red * 65535),
+            int(color.green * 65535),
+            int(color.blue * 65535)))
+    return lut
+
+
+print("prepare lookup tables..")
+lut_bright = create_lut(brightness=0.2)
+lut_dim = create_lut(brightness=0.1)
+
 ##########################################
 # main loop
 print(42 * '*')
 print("rainbow loop")
 while True:
+    position = int(offset * LUT_SIZE) % LUT_SIZE
+    position_half = (position + LUT_SIZE // 2) % LUT_SIZE
     for i in range(num_leds):
-        # Load each pixel's color from the palette using an offset, run it
-        # through the gamma function, pack RGB value and assign to pixel.
+        # Load each pixel's color from the lookup table using an offset
+        # and write it with the fast 16bit setter.
         # color = fancyled.palette_lookup(palette, offset + i / num_leds)
-        brightness = 0.2
-        color_offset = offset
+        pixel_lut = lut_bright
+        color_index = position
         if i % 2 == 0:
-            color_offset = offset + 0.5
-            # brightness = 0.1
+            color_index = position_half
         if i >= num_leds/2:
-            brightness = 0.1
-        color = fancyled.palette_lookup(palette, color_offset)
-        color = fancyled.gamma_adjust(color, brightness=brightness)
-        pixels[i] = color
+            pixel_lut = lut_dim
+        pixels.set_pixel_16bit_color(i, pixel_lut[color_index])
     pixels.show()
 
     offset += 0.005  # Bigger number = faster spin
@@ -37,13 +37,11 @@ spi_clock = digitalio.DigitalInOut(board.SCK)
 spi_clock.direction = digitalio.Direction.OUTPUT
 spi_mosi = digitalio.DigitalInOut(board.MOSI)
 spi_mosi.direction = digitalio.Direction.OUTPUT
-spi_miso = digitalio.DigitalInOut(board.MISO)
-spi_miso.direction = digitalio.Direction.INPUT
 
 # print((42 * '*') + "\n" + "init busio.SPI")
-# spi = busio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+# spi = busio.SPI(board.SCK, MOSI=board.MOSI)
 print("init bitbangio.SPI")
-spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI)
 
 # maximum frequency is currently hardcoded to 6MHz
 # https://github.com/adafruit/circuitpython/blob/master/ports/atmel-samd/common-hal/pulseio/PWMOut.c#L119
@@ -65,7 +63,6 @@ pixels = slight_tlc5957.TLC5957(
     gsclk=gsclk,
     spi_clock=spi_clock,
     spi_mosi=spi_mosi,
-    spi_miso=spi_miso,
     pixel_count=num_leds)
 
 print("pixel_count", pixels.pixel_count)
@@ -76,8 +73,7 @@ print("channel_count", pixels.channel_count)
 ##########################################
 print(42 * '*')
 print("set colors")
-for index in range(num_leds):
-    pixels[index] = (1, 1, 1)
+pixels.set_pixel_all_16bit_value(1, 1, 1)
 # write data to chips
 pixels.show()
 time.sleep(10)
@@ -87,20 +83,21 @@ print(42 * '*')
 print("loop..")
 value_high = 1000
 value_low = 1
+# time every channel is shown.
+# set to 0 to measure the raw speed of the channel sweep.
+channel_delay = 0.5
+# pause after every full sweep
+sweep_delay = 2
 while True:
-    pixel_active_index = 0
     for index in range(pixels.channel_count):
-        if index == pixel_active_index:
-            pixels.set_channel(index, value_high)
-            pixels.set_channel((index - 1) % pixels.channel_count, value_low)
-        pixel_active_index += 1
+        pixels.set_channel(index, value_high)
+        pixels.set_channel((index - 1) % pixels.channel_count, value_low)
         # write data to chips
         pixels.show()
-        # wait a second
-        time.sleep(0.5)
+        if channel_delay:
+            time.sleep(channel_delay)
     # set all to minimal
-    for index in range(num_leds):
-        pixels[index] = (value_low, value_low, value_low)
+    pixels.set_pixel_all_16bit_value(value_low, value_low, value_low)
     # write data to chips
     pixels.show()
-    time.sleep(2)
+    time.sleep(sweep_delay)
@@ -19,11 +19,12 @@ spi_clock = digitalio.DigitalInOut(board.SCK)
 spi_clock.direction = digitalio.Direction.OUTPUT
 spi_mosi = digitalio.DigitalInOut(board.MOSI)
 spi_mosi.direction = digitalio.Direction.OUTPUT
-spi_miso = digitalio.DigitalInOut(board.MISO)
-spi_miso.direction = digitalio.Direction.INPUT
 
-# spi = busio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
-spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI, MISO=board.MISO)
+# spi = busio.SPI(board.SCK, MOSI=board.MOSI)
+# busio.SPI would be about 10x faster -
+# but it claims the SCK & MOSI pins and so the library can not use them
+# to bit-bang the function commands (latch pulse inside the last bits).
+spi = bitbangio.SPI(board.SCK, MOSI=board.MOSI)
 
 # 6MHz for the grayscale clock
 gsclk = pulseio.PWMOut(
@@ -40,7 +41,6 @@ pixels = slight_tlc5957.TLC5957(
     gsclk=gsclk,
     spi_clock=spi_clock,
     spi_mosi=spi_mosi,
-    spi_miso=spi_miso,
     pixel_count=num_leds)
 
 
@@ -59,13 +59,11 @@ step = 500
 
 print("loop..")
 
-pixel_index = 3
-buffer_index = (
-    pixel_index * pixels.COLORS_PER_PIXEL * pixels.BUFFER_BYTES_PER_COLOR)
+# this does not change - so set it only once.
+pixels.set_pixel_all_16bit_value(1, 1, 1)
 
 while True:
     # pixels[3] = (0, 100, fade_value)
-    pixels.set_pixel_all_16bit_value(1, 1, 1)
     pixels.show()
     if (fade_value + step) > 65535 or (fade_value + step) < 0:
         step *= -1
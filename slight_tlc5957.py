@@ -51,6 +51,33 @@ Implementation Notes
 * Adafruit CircuitPython firmware for the supported boards:
   https://github.com/adafruit/circuitpython/releases
 
+**Data transfer:**
+
+* every 48bit word is shifted out with the SPI bus
+  and finished with a function command.
+  for the function commands the latch has to be high
+  during the last bits of the word -
+  these bits are bit-banged with ``digitalio``.
+* `show()` is blocking.
+  CircuitPython has no background (DMA) SPI write
+  and the bit-banged function commands need the CPU anyway -
+  so the next frame can only be prepared after `show()` returned.
+  a hardware only path would need a state machine that raises the latch
+  for the last N clock cycles of every word (e.g. a RP2040 PIO program) -
+  this is currently not implemented.
+* all chips are daisy-chained through one shift register
+  and every WRTGS moves the GS-counter to the next data latch.
+  so every `show()` has to clock out all 16 words for all chips -
+  partial updates of a single chip or a range of pixels are not possible.
+* the words are written directly from the pixel buffer
+  (through a persistent ``memoryview``) -
+  there is no per frame copy into a separate send buffer.
+* the pixel setters use ``struct.pack_into`` and slice assignments -
+  there are no ``@micropython.viper`` / ``@micropython.native`` helpers:
+  this is a single-file library that is compiled with ``mpy-cross``
+  for all ports - and ports with the native emitters disabled
+  could not load the module at all.
+
 """
 
 
@@ -60,11 +87,67 @@ __repo__ = "https://github.com/s-light/slight_CircuitPython_TLC5957.git"
 # imports
 
 # import time
+import struct
+from collections import namedtuple
+
+try:
+    from micropython import const
+except ImportError:
+    # plain CPython
+    def const(value):
+        """Stand-in for micropython.const."""
+        return value
 
 # from enum import Enum, unique
 # https://docs.python.org/3/library/enum.html
 # currently not supported by CircuitPython
 
+# the compiler inlines these constants in the hot pixel functions.
+_COLORS_PER_PIXEL = const(3)
+_BUFFER_BYTES_PER_COLOR = const(2)
+_BUFFER_BYTES_PER_PIXEL = const(6)
+
+# one function control field.
+# tuple index / attribute access is cheaper than string keyed dict lookups.
+# shifted_mask is the mask already moved to the field position.
+_FCField = namedtuple(
+    "_FCField", ("offset", "length", "mask", "default", "shifted_mask"))
+
+
+def _fc_field(offset, length, mask, default):
+    """Create function control field - precompute the shifted mask."""
+    return _FCField(offset, length, mask, default, mask << offset)
+
+
+_FC_FIELD_EMPTY = _fc_field(offset=0, length=0, mask=0, default=0)
+
+
+class _BatchUpdate(object):
+    """Context manager returned by `TLC5957.batch_update`.
+
+    (CircuitPython has no contextlib -
+    so this is a minimal class with __enter__ & __exit__.)
+    """
+
+    __slots__ = ("_pixels", "_defer_show_previous")
+
+    def __init__(self, pixels):
+        self._pixels = pixels
+        self._defer_show_previous = False
+
+    def __enter__(self):
+        # remember state - so nested blocks only write on the outermost exit
+        self._defer_show_previous = self._pixels._defer_show
+        self._pixels._defer_show = True
+        return self._pixels
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._pixels._defer_show = self._defer_show_previous
+        if exc_type is None and not self._defer_show_previous:
+            self._pixels.show()
+        # do not suppress exceptions
+        return False
+
 
 class TLC5957(object):
     """TLC5957 16-bit 48 channel LED PWM driver.
@@ -73,18 +156,60 @@ class TLC5957(object):
     The class has an interface compatible with FancyLED.
     and with this is similar to the NeoPixel and DotStar Interfaces.
 
-    :param ~busio.SPI spi: An instance of the SPI bus connected to the chip.
+    :param ~bitbangio.SPI spi: An instance of the SPI bus connected to the chip.
         The clock and MOSI must be set
         the MISO (input) is currently unused.
         Maximal data clock frequence is:
         - TLC5957: 33MHz
+        The function commands are bit-banged on the same pins
+        with ``spi_clock`` and ``spi_mosi`` -
+        so this has to be a ``bitbangio.SPI``:
+        a ``busio.SPI`` claims the pins for the hardware peripheral
+        and they can not be used as ``DigitalInOut`` at the same time.
+    :param ~digitalio.DigitalInOut spi_clock: The SPI clock pin object
+        (same pin as the SPI bus clock)
+        used to bit-bang the function commands.
+    :param ~digitalio.DigitalInOut spi_mosi: The SPI MOSI pin object
+        (same pin as the SPI bus MOSI)
+        used to bit-bang the function commands.
     :param ~digitalio.DigitalInOut latch: The chip LAT (latch) pin object
         that implements the DigitalInOut API.
     :param ~pulseio.PWMOut gsclk: The chip Grayscale Clock pin object
         that implements the PWMOut API.
     :param bool pixel_count: Number of RGB-LEDs (=Pixels) are connected.
+    :param ~digitalio.DigitalInOut spi_miso: The SPI MISO pin object.
+        optional - the TLC5957 is only written to, so this is unused.
+    :param int spi_baudrate: SPI data clock frequency in Hz.
+        defaults to 10MHz.
+        (the TLC5957 can handle up to 33MHz)
     """
 
+    # pins, bus settings and the precomputed buffers / views
+    # pylint: disable=too-many-instance-attributes
+
+    # no per instance __dict__ on CPython
+    # (MicroPython / CircuitPython ignores this)
+    __slots__ = (
+        "_spi",
+        "_spi_clock",
+        "_spi_mosi",
+        "_spi_miso",
+        "_spi_baudrate",
+        "_spi_configured",
+        "_latch",
+        "_gsclk",
+        "pixel_count",
+        "chip_count",
+        "channel_count",
+        "_buffer",
+        "_buffer_fc",
+        "_buffer_mv",
+        "_buffer_fc_mv",
+        "_write_count",
+        "_spi_write_start_end",
+        "_defer_show",
+    )
+
     # TLC5957 data / register structure
     #
     # some detailed information on the protocol based on
@@ -94,12 +219,12 @@ class TLC5957(object):
     # helper
     ##########################################
 
-    COLORS_PER_PIXEL = 3
+    COLORS_PER_PIXEL = _COLORS_PER_PIXEL
     PIXEL_PER_CHIP = 16
     CHANNEL_PER_CHIP = COLORS_PER_PIXEL * PIXEL_PER_CHIP
 
-    BUFFER_BYTES_PER_COLOR = 2
-    BUFFER_BYTES_PER_PIXEL = BUFFER_BYTES_PER_COLOR * COLORS_PER_PIXEL
+    BUFFER_BYTES_PER_COLOR = _BUFFER_BYTES_PER_COLOR
+    BUFFER_BYTES_PER_PIXEL = _BUFFER_BYTES_PER_PIXEL
 
     CHIP_BUFFER_BIT_COUNT = 48
     CHIP_BUFFER_BYTE_COUNT = CHIP_BUFFER_BIT_COUNT // 8
@@ -110,12 +235,10 @@ class TLC5957(object):
     @staticmethod
     def set_bit_with_mask(value, mask, value_new):
         """Set bit with help of mask."""
-        # clear
-        value &= ~mask
-        if value_new:
-            # set
-            value |= mask
-        return value
+        # clear and set without branch:
+        # -True == -1 == all bits set → the mask stays.
+        # -False == 0 → nothing is set.
+        return (value & ~mask) | (-bool(value_new) & mask)
 
     @staticmethod
     def set_bit(value, index, value_new):
@@ -127,13 +250,9 @@ class TLC5957(object):
         """
         # Compute mask, an integer with just bit 'index' set.
         mask = 1 << index
-        # Clear the bit indicated by the mask (if x is False)
-        value &= ~mask
-        if value_new:
-            # If x was True, set the bit indicated by the mask.
-            value |= mask
-        # Return the result, we're done.
-        return value
+        # Clear the bit indicated by the mask
+        # and set it again if value_new is truthy - without a branch.
+        return (value & ~mask) | (-bool(value_new) & mask)
 
     ##########################################
     # class Function_Command():
@@ -200,6 +319,25 @@ class TLC5957(object):
     _FC__TMGRST = 13
     _FC__FCWRTEN = 15
 
+    # the latch is high for the last <command> bits of the 16bit word.
+    # precompute per command:
+    # (bytes to send with the SPI bus,
+    #  bits to bang before the latch rises,
+    #  bits to bang with the latch high)
+    _FC_LATCH_TABLE = {}
+    for _function_command in (
+            _FC__WRTGS, _FC__LATGS, _FC__WRTFC, _FC__LINERESET,
+            _FC__READFC, _FC__TMGRST, _FC__FCWRTEN):
+        _latch_start_index = CHIP_FUNCTION_CMD_BIT_COUNT - _function_command
+        # a full byte in front of the latch start can go with the SPI bus
+        _spi_byte_count = _latch_start_index // 8
+        _FC_LATCH_TABLE[_function_command] = (
+            _spi_byte_count,
+            _latch_start_index - (_spi_byte_count * 8),
+            _function_command,
+        )
+    del _function_command, _latch_start_index, _spi_byte_count
+
     ##########################################
     # 3.3.3 Function Control (FC) Register
     # BIT     NAME            default     description
@@ -241,98 +379,46 @@ class TLC5957(object):
     # _FC_CHIP_BUFFER_BIT_OFFSET = _BC_BIT_COUNT
     _FC_BIT_COUNT = CHIP_BUFFER_BIT_COUNT
     _FC_FIELDS = {
-        "LODVTH": {
-            "offset": 0,
-            "length": 2,
-            "mask": 0b11,
-            "default": 0b01,
-        },
-        "SEL_TD0": {
-            "offset": 2,
-            "length": 2,
-            "mask": 0b11,
-            "default": 0b01,
-        },
-        "SEL_GDLY": {
-            "offset": 4,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b1,
-        },
-        "XREFRESH": {
-            "offset": 5,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b0,
-        },
-        "SEL_GCK_EDGE": {
-            "offset": 6,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b0,
-        },
-        "SEL_PCHG": {
-            "offset": 7,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b0,
-        },
-        "ESPWM": {
-            "offset": 8,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b0,
-        },
-        "LGSE3": {
-            "offset": 9,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b0,
-        },
-        "LGSE1": {
-            "offset": 11,
-            "length": 3,
-            "mask": 0b111,
-            "default": 0b000,
-        },
-        "CCB": {
-            "offset": 14,
-            "length": 9,
-            "mask": 0b111111111,
-            "default": 0b100000000,
-        },
-        "CCG": {
-            "offset": 23,
-            "length": 9,
-            "mask": 0b111111111,
-            "default": 0b100000000,
-        },
-        "CCR": {
-            "offset": 32,
-            "length": 9,
-            "mask": 0b111111111,
-            "default": 0b100000000,
-        },
-        "BC": {
-            "offset": 41,
-            "length": 3,
-            "mask": 0b111,
-            "default": 0b100,
-        },
-        "PokerTransMode": {
-            "offset": 44,
-            "length": 1,
-            "mask": 0b1,
-            "default": 0b0,
-        },
-        "LGSE2": {
-            "offset": 45,
-            "length": 3,
-            "mask": 0b111,
-            "default": 0b000,
-        },
+        "LODVTH": _fc_field(
+            offset=0, length=2, mask=0b11, default=0b01),
+        "SEL_TD0": _fc_field(
+            offset=2, length=2, mask=0b11, default=0b01),
+        "SEL_GDLY": _fc_field(
+            offset=4, length=1, mask=0b1, default=0b1),
+        "XREFRESH": _fc_field(
+            offset=5, length=1, mask=0b1, default=0b0),
+        "SEL_GCK_EDGE": _fc_field(
+            offset=6, length=1, mask=0b1, default=0b0),
+        "SEL_PCHG": _fc_field(
+            offset=7, length=1, mask=0b1, default=0b0),
+        "ESPWM": _fc_field(
+            offset=8, length=1, mask=0b1, default=0b0),
+        "LGSE3": _fc_field(
+            offset=9, length=1, mask=0b1, default=0b0),
+        "LGSE1": _fc_field(
+            offset=11, length=3, mask=0b111, default=0b000),
+        "CCB": _fc_field(
+            offset=14, length=9, mask=0b111111111, default=0b100000000),
+        "CCG": _fc_field(
+            offset=23, length=9, mask=0b111111111, default=0b100000000),
+        "CCR": _fc_field(
+            offset=32, length=9, mask=0b111111111, default=0b100000000),
+        "BC": _fc_field(
+            offset=41, length=3, mask=0b111, default=0b100),
+        "PokerTransMode": _fc_field(
+            offset=44, length=1, mask=0b1, default=0b0),
+        "LGSE2": _fc_field(
+            offset=45, length=3, mask=0b111, default=0b000),
     }
 
+    # the defaults are the same for all chips -
+    # so they are combined to one 48bit header only once.
+    # (the fields do not overlap - so sum() is the same as or-ing them.)
+    _FC_DEFAULT_BYTES = sum(
+        (field.default & field.mask) << field.offset
+        for field in _FC_FIELDS.values()
+    ).to_bytes(6, "big")
+
     ##########################################
 
     ##########################################
@@ -343,10 +429,11 @@ class TLC5957(object):
             spi,
             spi_clock,
             spi_mosi,
-            spi_miso,
             latch,
             gsclk,
-            pixel_count=16):
+            pixel_count=16,
+            spi_miso=None,
+            spi_baudrate=(10 * 1000 * 1000)):
         """Init."""
         # i don't see a better way to get all this initialised...
         # pylint: disable=too-many-arguments
@@ -355,6 +442,11 @@ class TLC5957(object):
         self._spi_clock = spi_clock
         self._spi_mosi = spi_mosi
         self._spi_miso = spi_miso
+        self._spi_baudrate = spi_baudrate
+        # the bus is configured on the first write
+        self._spi_configured = False
+        # set inside of batch_update
+        self._defer_show = False
         self._latch = latch
         self._gsclk = gsclk
         # how many pixels are there?
@@ -368,13 +460,28 @@ class TLC5957(object):
         self.channel_count = self.pixel_count * self.COLORS_PER_PIXEL
 
         # data is stored in raw buffer
+        # already in the big-endian on-wire format.
+        # (an array.array('H') would need a byteswap before and after
+        # every show() - and CircuitPython arrays have no byteswap.
+        # the setters write whole pixels with struct.pack_into anyway.)
         self._buffer = bytearray(
             self.CHIP_GS_BUFFER_BYTE_COUNT * self.chip_count)
         # print("CHIP_GS_BUFFER_BYTE_COUNT", self.CHIP_GS_BUFFER_BYTE_COUNT)
         # print("_buffer", self._buffer)
+        # bytes sent with the SPI bus in front of every function command.
+        # this is the same for every GS word and the FC data.
+        self._write_count = (
+            self.CHIP_BUFFER_BYTE_COUNT * self.chip_count
+            - self.CHIP_FUNCTION_CMD_BYTE_COUNT)
 
         self._buffer_fc = bytearray(
             self.CHIP_BUFFER_BYTE_COUNT * self.chip_count)
+        # persistent views - slicing a memoryview does not copy the data.
+        # used for all internal sub-range access and the SPI writes.
+        self._buffer_mv = memoryview(self._buffer)
+        self._buffer_fc_mv = memoryview(self._buffer_fc)
+        # busio.SPI.write supports start & end - bitbangio.SPI.write not.
+        self._spi_write_start_end = self._check_spi_write_start_end()
         self._init_buffer_fc()
         self.update_fc()
         # self.print_buffer_fc()
@@ -383,97 +490,112 @@ class TLC5957(object):
         self.show()
         self.show()
 
+    def _check_spi_write_start_end(self):
+        """Check if `spi.write` accepts the start & end arguments."""
+        try:
+            # wait untill we have access to / locked SPI bus
+            while not self._spi.try_lock():
+                pass
+            # zero length write - nothing is clocked out.
+            self._spi.write(self._buffer, start=0, end=0)
+        except TypeError:
+            return False
+        finally:
+            # Ensure the SPI bus is unlocked.
+            self._spi.unlock()
+        return True
+
     def _write_buffer_GS(self):
         # Write out the current state to the shift register.
         buffer_start = 0
-        write_count = (
-            (self.CHIP_BUFFER_BYTE_COUNT * self.chip_count)
-            - self.CHIP_FUNCTION_CMD_BYTE_COUNT)
-
-        for index in range(self.PIXEL_PER_CHIP):
-            try:
-                # wait untill we have access to / locked SPI bus
-                while not self._spi.try_lock():
-                    pass
-                # configure
-                # 10kHz
-                # baudrate = (10 * 1000)
-                # 1MHz
-                # baudrate = (1000 * 1000)
-                # 10MHz
-                baudrate = (10 * 1000 * 1000)
-                self._spi.configure(
-                    baudrate=baudrate, polarity=0, phase=0, bits=8)
-
+        write_count = self._write_count
+
+        # the chips need a WRTGS / LATGS function command
+        # at the end of every 48bit GS word -
+        # so we can not send the whole frame with one write.
+        # but we lock the bus only once for the whole frame.
+        # local names for everything used inside the loop
+        spi = self._spi
+        buffer = self._buffer_mv
+        write_start_end = self._spi_write_start_end
+        write_function_command = self._write_buffer_with_function_command
+        last_index = self.PIXEL_PER_CHIP - 1
+        fc_wrtgs = self._FC__WRTGS
+        fc_latgs = self._FC__LATGS
+        function_cmd_byte_count = self.CHIP_FUNCTION_CMD_BYTE_COUNT
+        try:
+            # wait untill we have access to / locked SPI bus
+            while not spi.try_lock():
+                pass
+            # configure - the settings never change.
+            # so this is only needed once.
+            if not self._spi_configured:
+                spi.configure(
+                    baudrate=self._spi_baudrate, polarity=0, phase=0, bits=8)
+                self._spi_configured = True
+
+            for index in range(self.PIXEL_PER_CHIP):
                 # write data
-                # self._spi.write(
-                #     self._buffer, start=buffer_start, end=write_count)
-
-                # workaround for bitbangio.SPI.write missing start & end
-                buffer_in = bytearray(write_count)
-                self._spi.write_readinto(
-                    self._buffer,
-                    buffer_in,
-                    out_start=buffer_start,
-                    out_end=buffer_start + write_count)
-
-            finally:
-                # Ensure the SPI bus is unlocked.
-                self._spi.unlock()
-            buffer_start += write_count
-            # special
-            if index == self.PIXEL_PER_CHIP - 1:
-                self._write_buffer_with_function_command(
-                    self._FC__LATGS, buffer_start, self._buffer)
-            else:
-                self._write_buffer_with_function_command(
-                    self._FC__WRTGS, buffer_start, self._buffer)
-            buffer_start += self.CHIP_FUNCTION_CMD_BYTE_COUNT
+                if write_start_end:
+                    spi.write(
+                        buffer,
+                        start=buffer_start,
+                        end=buffer_start + write_count)
+                else:
+                    # workaround for bitbangio.SPI.write missing start & end.
+                    # the TLC5957 is only written to -
+                    # so there is no need for write_readinto.
+                    spi.write(buffer[buffer_start:buffer_start + write_count])
+                buffer_start += write_count
+                # special
+                if index == last_index:
+                    write_function_command(fc_latgs, buffer_start, buffer)
+                else:
+                    write_function_command(fc_wrtgs, buffer_start, buffer)
+                buffer_start += function_cmd_byte_count
+        finally:
+            # Ensure the SPI bus is unlocked.
+            spi.unlock()
 
     def _write_buffer_FC(self):
         # Write out the current state to the shift register.
         buffer_start = 0
-        write_count = (
-            (self.CHIP_BUFFER_BYTE_COUNT * self.chip_count)
-            - self.CHIP_FUNCTION_CMD_BYTE_COUNT)
-
-        # enable FC write
-        self._write_buffer_with_function_command(
-            self._FC__FCWRTEN, buffer_start, self._buffer_fc)
+        write_count = self._write_count
+        buffer = self._buffer_fc_mv
 
+        # the whole sequence FCWRTEN → data → WRTFC
+        # is sent while we hold the bus lock.
         try:
             # wait untill we have access to / locked SPI bus
             while not self._spi.try_lock():
                 pass
             # configure
-            # 10kHz
-            # baudrate = (10 * 1000)
-            # 1MHz
-            # baudrate = (1000 * 1000)
-            # 10MHz
-            baudrate = (10 * 1000 * 1000)
-            self._spi.configure(
-                baudrate=baudrate, polarity=0, phase=0, bits=8)
-
-            # write data
-            # self._spi.write(
-            #     self._buffer, start=buffer_start, end=write_count)
+            if not self._spi_configured:
+                self._spi.configure(
+                    baudrate=self._spi_baudrate, polarity=0, phase=0, bits=8)
+                self._spi_configured = True
 
-            # workaround for bitbangio.SPI.write missing start & end
-            buffer_in = bytearray(write_count)
-            self._spi.write_readinto(
-                self._buffer_fc,
-                buffer_in,
-                out_start=buffer_start,
-                out_end=buffer_start + write_count)
+            # enable FC write
+            self._write_buffer_with_function_command(
+                self._FC__FCWRTEN, buffer_start, buffer)
 
+            # write data
+            if self._spi_write_start_end:
+                self._spi.write(
+                    buffer,
+                    start=buffer_start,
+                    end=buffer_start + write_count)
+            else:
+                # workaround for bitbangio.SPI.write missing start & end
+                self._spi.write(
+                    buffer[buffer_start:buffer_start + write_count])
+            buffer_start += write_count
+            # special
+            self._write_buffer_with_function_command(
+                self._FC__WRTFC, buffer_start, buffer)
         finally:
             # Ensure the SPI bus is unlocked.
             self._spi.unlock()
-        buffer_start += write_count
-        # special
-        self._write_buffer_with_function_command(
-            self._FC__WRTFC, buffer_start, self._buffer_fc)
         # done.
 
     def _write_buffer_with_function_command(
@@ -481,44 +603,75 @@ class TLC5957(object):
             function_command,
             buffer_start,
             buffer):
-        """Bit-Banging SPI write to sync with latch pulse."""
-        # combine two 8bit buffer parts to 16bit value
-        value = (
-            (buffer[buffer_start + 0] << 8) |
-            buffer[buffer_start + 1]
-        )
-
-        self._spi_clock.value = 0
-        self._spi_mosi.value = 0
-        self._latch.value = 0
-        latch_start_index = self.CHIP_FUNCTION_CMD_BIT_COUNT - function_command
-        for index in range(self.CHIP_FUNCTION_CMD_BIT_COUNT):
-            if latch_start_index == index:
-                self._latch.value = 1
+        """
+        Bit-Banging SPI write to sync with latch pulse.
 
+        a full byte in front of the latch start is sent with the SPI bus.
+        only the rest is bit-banged.
+        the SPI bus has to be locked.
+        """
+        # read the big-endian 16bit command word in one C level call
+        value = struct.unpack_from(">H", buffer, buffer_start)[0]
+
+        spi_byte_count, bit_count_low, bit_count_high = (
+            self._FC_LATCH_TABLE[function_command])
+        if spi_byte_count:
+            # the latch rises in the second byte -
+            # so we can send the first one with the SPI bus.
+            self._spi.write(buffer[buffer_start:buffer_start + 1])
+            value <<= 8
+
+        spi_clock = self._spi_clock
+        spi_mosi = self._spi_mosi
+        latch = self._latch
+        spi_clock.value = 0
+        spi_mosi.value = 0
+        latch.value = 0
+        # bits in front of the latch start
+        for _ in range(bit_count_low):
             # b1000000000000000
-            if value & 0x8000:
-                self._spi_mosi.value = 1
-            else:
-                self._spi_mosi.value = 0
+            spi_mosi.value = bool(value & 0x8000)
             value <<= 1
-
             # CircuitPython needs 14us for this setting pin high and low again.
-            self._spi_clock.value = 1
-            # 1ms
-            # time.sleep(0.001)
-            # 100us
-            # time.sleep(0.0001)
-            # 10us
-            # time.sleep(0.00001)
-            self._spi_clock.value = 0
-
-        self._latch.value = 0
+            spi_clock.value = 1
+            spi_clock.value = 0
+        # bits with latch high
+        latch.value = 1
+        for _ in range(bit_count_high):
+            spi_mosi.value = bool(value & 0x8000)
+            value <<= 1
+            spi_clock.value = 1
+            spi_clock.value = 0
+        latch.value = 0
 
     def show(self):
-        """Write out Grayscale Values to chips."""
+        """
+        Write out Grayscale Values to chips.
+
+        this always writes the full frame for all chips.
+        inside of a `batch_update` block this does nothing -
+        the frame is written once at the end of the block.
+        """
+        if self._defer_show:
+            return
         self._write_buffer_GS()
 
+    def batch_update(self):
+        """
+        Combine many updates to one frame write.
+
+        use as context manager::
+
+            with pixels.batch_update():
+                pixels[0] = (1.0, 0, 0)
+                pixels.set_pixel_all_16bit_value(0, 0, 100)
+                pixels.show()  # deferred
+
+        `show()` calls inside of the block are deferred -
+        the full frame is written once when the block ends without error.
+        """
+        return _BatchUpdate(self)
+
     def update_fc(self):
         """Write out Function_Command Values to chips."""
         self._write_buffer_FC()
@@ -531,7 +684,7 @@ class TLC5957(object):
             *, #noqa
             chip_index=0,
             part_bit_offset=0,
-            field={"mask": 0, "length": 0, "offset": 0, "default": 0},
+            field=_FC_FIELD_EMPTY,
             value=0
     ):
         """Set function control bits in buffer."""
@@ -547,33 +700,39 @@ class TLC5957(object):
         #         value
         #     )
         # )
-        offset = part_bit_offset + field["offset"]
+        if part_bit_offset:
+            offset = part_bit_offset + field.offset
+            # create/move mask
+            mask = field.mask << offset
+        else:
+            # precomputed
+            offset = field.offset
+            mask = field.shifted_mask
         # restrict value
-        value &= field["mask"]
+        value &= field.mask
         # move value to position
         value = value << offset
         # calculate header start
         header_start = chip_index * self.CHIP_BUFFER_BYTE_COUNT
         # get chip header
         header = self._get_48bit_value_from_buffer(
-            self._buffer_fc, header_start)
+            self._buffer_fc_mv, header_start)
         # print("{:048b}".format(header))
         # 0xFFFFFFFFFFFF == 0b11111111111111111111111111111111....
-        # create/move mask
-        mask = field["mask"] << offset
         # clear
         header &= ~mask
         # set
         header |= value
         # write header back
-        self._set_48bit_value_in_buffer(self._buffer_fc, header_start, header)
+        self._set_48bit_value_in_buffer(
+            self._buffer_fc_mv, header_start, header)
 
     def get_fc_bits_in_buffer(
             self,
             *, #noqa
             chip_index=0,
             part_bit_offset=0,
-            field={"mask": 0, "length": 0, "offset": 0, "default": 0},
+            field=_FC_FIELD_EMPTY,
     ):
         """Get function control bits in buffer."""
         # print(
@@ -586,29 +745,56 @@ class TLC5957(object):
         #         field,
         #     )
         # )
-        offset = part_bit_offset + field["offset"]
+        offset = part_bit_offset + field.offset
         # calculate header start
         header_start = chip_index * self.CHIP_BUFFER_BYTE_COUNT
         # get chip header
         header = self._get_48bit_value_from_buffer(
-            self._buffer_fc, header_start)
+            self._buffer_fc_mv, header_start)
         # print("{:048b}".format(header))
-        # 0xFFFFFFFFFFFF == 0b11111111111111111111111111111111....
-        # create/move mask
-        mask = field["mask"] << offset
-        value = header & mask
-        # move value to position
-        value = value >> offset
-        return value
+        # move value to position first -
+        # so the unshifted field mask can be used.
+        return (header >> offset) & field.mask
+
+    @staticmethod
+    def _combine_fc_fields(fields_values):
+        """Combine (field, value) pairs to one shifted mask & bits."""
+        mask = 0
+        bits = 0
+        for field, value in fields_values:
+            mask |= field.shifted_mask
+            bits |= (value & field.mask) << field.offset
+        return mask, bits
+
+    def _set_fc_header_bits(self, chip_index, mask, bits):
+        """Set already shifted bits in the function control of one chip."""
+        header_start = chip_index * self.CHIP_BUFFER_BYTE_COUNT
+        header = self._get_48bit_value_from_buffer(
+            self._buffer_fc_mv, header_start)
+        header = (header & ~mask) | bits
+        self._set_48bit_value_in_buffer(
+            self._buffer_fc_mv, header_start, header)
+
+    def _set_fc_header_bits_all(self, mask, bits):
+        """Set already shifted bits in the function control of all chips."""
+        buffer = self._buffer_fc_mv
+        byte_count = self.CHIP_BUFFER_BYTE_COUNT
+        get_48bit = self._get_48bit_value_from_buffer
+        set_48bit = self._set_48bit_value_in_buffer
+        mask_inverted = ~mask
+        for chip_index in range(self.chip_count):
+            header_start = chip_index * byte_count
+            header = get_48bit(buffer, header_start)
+            set_48bit(buffer, header_start, (header & mask_inverted) | bits)
 
     def _init_buffer_fc(self):
+        # copy the precomputed default header to every chip
+        header_bytes = self._FC_DEFAULT_BYTES
+        byte_count = self.CHIP_BUFFER_BYTE_COUNT
         for i in range(self.chip_count):
-            for name, field in self._FC_FIELDS.items():
-                self.set_fc_bits_in_buffer(
-                    chip_index=i,
-                    field=field,
-                    value=field["default"]
-                )
+            header_start = i * byte_count
+            self._buffer_fc_mv[header_start:header_start + byte_count] = (
+                header_bytes)
 
     def _print_buffer_fc__find_max_length(self):
         # find longest name
@@ -621,9 +807,9 @@ class TLC5957(object):
         for name, content in self._FC_FIELDS.items():
             if max_length['name'] < len(name):
                 max_length['name'] = len(name)
-            if max_length['value_bin'] < content["length"]:
-                max_length['value_bin'] = content["length"]
-            mask_as_hex_len = len("{:x}".format(content["mask"]))
+            if max_length['value_bin'] < content.length:
+                max_length['value_bin'] = content.length
+            mask_as_hex_len = len("{:x}".format(content.mask))
             if max_length['value_hex'] < mask_as_hex_len:
                 max_length['value_hex'] = mask_as_hex_len
         return max_length
@@ -634,7 +820,7 @@ class TLC5957(object):
         for name, field in self._FC_FIELDS.items():
             result[name] = []
             # add default
-            result[name].append(field["default"])
+            result[name].append(field.default)
 
         for i in range(self.chip_count):
             for name, field in self._FC_FIELDS.items():
@@ -690,46 +876,40 @@ class TLC5957(object):
     def set_fc_CC(
             self,
             chip_index=0,
-            CCR=_FC_FIELDS['CCR']['default'],
-            CCG=_FC_FIELDS['CCG']['default'],
-            CCB=_FC_FIELDS['CCB']['default'],
+            CCR=_FC_FIELDS['CCR'].default,
+            CCG=_FC_FIELDS['CCG'].default,
+            CCB=_FC_FIELDS['CCB'].default,
     ):
         """Set color control for R, G, B."""
-        self.set_fc_bits_in_buffer(
-            chip_index=chip_index,
-            field=self._FC_FIELDS["CCR"],
-            value=CCR
-        )
-        self.set_fc_bits_in_buffer(
-            chip_index=chip_index,
-            field=self._FC_FIELDS["CCG"],
-            value=CCG
-        )
-        self.set_fc_bits_in_buffer(
-            chip_index=chip_index,
-            field=self._FC_FIELDS["CCB"],
-            value=CCB
-        )
+        # combine the three fields -
+        # so the chip header is only read & written once.
+        mask, bits = self._combine_fc_fields((
+            (self._FC_FIELDS["CCR"], CCR),
+            (self._FC_FIELDS["CCG"], CCG),
+            (self._FC_FIELDS["CCB"], CCB),
+        ))
+        self._set_fc_header_bits(chip_index, mask, bits)
 
     def set_fc_CC_all(
             self,
-            CCR=_FC_FIELDS['CCR']['default'],
-            CCG=_FC_FIELDS['CCG']['default'],
-            CCB=_FC_FIELDS['CCB']['default'],
+            CCR=_FC_FIELDS['CCR'].default,
+            CCG=_FC_FIELDS['CCG'].default,
+            CCB=_FC_FIELDS['CCB'].default,
     ):
         """Set color control for R, G, B for all chips."""
-        for chip_index in range(self.chip_count):
-            self.set_fc_CC(
-                chip_index=chip_index,
-                CCR=CCR,
-                CCG=CCG,
-                CCB=CCB,
-            )
+        # combine the three fields once -
+        # so every chip header is only read & written once.
+        mask, bits = self._combine_fc_fields((
+            (self._FC_FIELDS["CCR"], CCR),
+            (self._FC_FIELDS["CCG"], CCG),
+            (self._FC_FIELDS["CCB"], CCB),
+        ))
+        self._set_fc_header_bits_all(mask, bits)
 
     def set_fc_BC(
             self,
             chip_index=0,
-            BC=_FC_FIELDS['BC']['default'],
+            BC=_FC_FIELDS['BC'].default,
     ):
         """Set brightness control."""
         self.set_fc_bits_in_buffer(
@@ -740,11 +920,11 @@ class TLC5957(object):
 
     def set_fc_BC_all(
             self,
-            BC=_FC_FIELDS['BC']['default'],
+            BC=_FC_FIELDS['BC'].default,
     ):
         """Set brightness control for all chips."""
-        for chip_index in range(self.chip_count):
-            self.set_fc_BC(chip_index=chip_index, BC=BC)
+        mask, bits = self._combine_fc_fields(((self._FC_FIELDS["BC"], BC),))
+        self._set_fc_header_bits_all(mask, bits)
 
     def set_fc_ESPWM(
             self,
@@ -763,38 +943,27 @@ class TLC5957(object):
             enable=False,
     ):
         """Set ESPWM for all chips."""
-        for chip_index in range(self.chip_count):
-            self.set_fc_ESPWM(chip_index=chip_index, enable=enable)
+        mask, bits = self._combine_fc_fields(
+            ((self._FC_FIELDS["ESPWM"], enable),))
+        self._set_fc_header_bits_all(mask, bits)
 
     ##########################################
     # GS things
 
     @staticmethod
     def _get_48bit_value_from_buffer(buffer, buffer_start):
-        return (
-            (buffer[buffer_start + 0] << 40) |
-            (buffer[buffer_start + 1] << 32) |
-            (buffer[buffer_start + 2] << 24) |
-            (buffer[buffer_start + 3] << 16) |
-            (buffer[buffer_start + 4] << 8) |
-            buffer[buffer_start + 5]
-        )
+        return int.from_bytes(buffer[buffer_start:buffer_start + 6], "big")
 
     @staticmethod
     def _set_48bit_value_in_buffer(buffer, buffer_start, value):
         if not 0 <= value <= 0xFFFFFFFFFFFF:
             raise ValueError(
-                "value {} not in range: 0..0xFFFFFFFF"
+                "value {} not in range: 0..0xFFFFFFFFFFFF"
                 "".format(value)
             )
         # print("buffer_start", buffer_start, "value", value)
         # self._debug_print_buffer()
-        buffer[buffer_start + 0] = (value >> 40) & 0xFF
-        buffer[buffer_start + 1] = (value >> 32) & 0xFF
-        buffer[buffer_start + 2] = (value >> 24) & 0xFF
-        buffer[buffer_start + 3] = (value >> 16) & 0xFF
-        buffer[buffer_start + 4] = (value >> 8) & 0xFF
-        buffer[buffer_start + 5] = value & 0xFF
+        buffer[buffer_start:buffer_start + 6] = value.to_bytes(6, "big")
 
     # 32bit_value
     # def _get_32bit_value_from_buffer(self, buffer_start):
@@ -818,81 +987,52 @@ class TLC5957(object):
     #     self._buffer[buffer_start + 2] = (value >> 8) & 0xFF
     #     self._buffer[buffer_start + 3] = value & 0xFF
 
-    def _get_16bit_value_from_buffer(self, buffer_start):
-        return (
-            (self._buffer[buffer_start + 0] << 8) |
-            self._buffer[buffer_start + 1]
-        )
-
-    def _set_16bit_value_in_buffer(self, buffer_start, value):
-        assert 0 <= value <= 65535
-        # print("buffer_start", buffer_start, "value", value)
-        self._buffer[buffer_start + 0] = (value >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value & 0xFF
-
     @staticmethod
-    def _convert_01_float_to_16bit_integer(value):
-        """Convert 0..1 Float Value to 16bit (0..65535) Range."""
-        # check if value is in range
-        if not 0.0 <= value[0] <= 1.0:
+    def _check_and_convert_channel(value):
+        """Check range and convert one channel value to 16bit integer."""
+        if isinstance(value, float):
+            # the limits need no float multiplication
+            # (boards without FPU do this in software)
+            if value == 0.0:
+                return 0
+            if value == 1.0:
+                return 65535
+            if not 0.0 < value < 1.0:
+                raise ValueError(
+                    "value {} not in range: 0..1"
+                    "".format(value)
+                )
+            return int(value * 65535)
+        if not 0 <= value <= 65535:
             raise ValueError(
-                "value[0] {} not in range: 0..1"
-                "".format(value[0])
+                "value {} not in range: 0..65535"
+                "".format(value)
             )
-        # convert to 16bit value
-        return int(value * 65535)
+        return value
 
     @classmethod
-    def _convert_if_float(cls, value):
-        """Convert if value is Float."""
-        if isinstance(value, float):
-            value = cls._convert_01_float_to_16bit_integer(value)
-        return value
+    def _check_and_convert(cls, value):
+        """Check & convert all channels of value - return new 3-tuple."""
+        convert = cls._check_and_convert_channel
+        return (convert(value[0]), convert(value[1]), convert(value[2]))
 
     @staticmethod
-    def _check_and_convert(value):
-        # check if we have float values
-        if isinstance(value[0], float):
-            # check if value is in range
-            if not 0.0 <= value[0] <= 1.0:
-                raise ValueError(
-                    "value[0] {} not in range: 0..1"
-                    "".format(value[0])
-                )
-            # convert to 16bit value
-            value[0] = int(value[0] * 65535)
-        else:
-            if not 0 <= value[0] <= 65535:
-                raise ValueError(
-                    "value[0] {} not in range: 0..65535"
-                    "".format(value[0])
-                )
-        if isinstance(value[1], float):
-            if not 0.0 <= value[1] <= 1.0:
-                raise ValueError(
-                    "value[1] {} not in range: 0..1"
-                    "".format(value[1])
-                )
-            value[1] = int(value[1] * 65535)
-        else:
-            if not 0 <= value[1] <= 65535:
-                raise ValueError(
-                    "value[1] {} not in range: 0..65535"
-                    "".format(value[1])
-                )
-        if isinstance(value[2], float):
-            if not 0.0 <= value[2] <= 1.0:
-                raise ValueError(
-                    "value[2] {} not in range: 0..1"
-                    "".format(value[2])
-                )
-            value[2] = int(value[2] * 65535)
-        else:
-            if not 0 <= value[2] <= 65535:
-                raise ValueError(
-                    "value[2] {} not in range: 0..65535"
-                    "".format(value[2])
-                )
+    def _check_and_convert_array(array):
+        """Check range & convert a whole numpy array in one pass.
+
+        float arrays are scaled to 0..65535 -
+        the cast to 16bit integer is left to the caller.
+        """
+        # min / max are vectorized - no python level loop.
+        # (NaN fails both compares and so is rejected too.)
+        if array.dtype.kind == "f":
+            if array.size and not (
+                    array.min() >= 0.0 and array.max() <= 1.0):
+                raise ValueError("array values not in range: 0..1")
+            return array * 65535
+        if array.size and not (array.min() >= 0 and array.max() <= 65535):
+            raise ValueError("array values not in range: 0..65535")
+        return array
 
     ##########################################
 
@@ -901,99 +1041,96 @@ class TLC5957(object):
         Set the value for pixel.
 
         This is a Fast UNPROTECTED function:
-        no error / range checking is done.
+        no error / range checking is done -
+        out of range values wrap around (only the lower 16bit are used).
+        the values are expected as 16bit integers -
+        no float conversion is done.
 
         :param int pixel_index: 0..(pixel_count)
         :param int value_r: 0..65535
         :param int value_g: 0..65535
         :param int value_b: 0..65535
         """
-        pixel_start = pixel_index * self.COLORS_PER_PIXEL
-        buffer_start = (pixel_start + 0) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_b >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_b & 0xFF
-        buffer_start = (pixel_start + 1) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_g >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_g & 0xFF
-        buffer_start = (pixel_start + 2) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_r >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_r & 0xFF
+        # one C level call writes all three big-endian words.
+        # buffer channel order is blue, green, red
+        struct.pack_into(
+            ">HHH",
+            self._buffer,
+            pixel_index * _BUFFER_BYTES_PER_PIXEL,
+            value_b & 0xFFFF,
+            value_g & 0xFFFF,
+            value_r & 0xFFFF
+        )
 
     def set_pixel_float_value(self, pixel_index, value_r, value_g, value_b):
         """
         Set the value for pixel.
 
         This is a Fast UNPROTECTED function:
-        no error / range checking is done.
+        no error / range checking is done -
+        out of range values wrap around (only the lower 16bit are used).
 
         :param int pixel_index: 0..(pixel_count)
         :param int value_r: 0..1
         :param int value_g: 0..1
         :param int value_b: 0..1
         """
-        value_r = int(value_r * 65535)
-        value_g = int(value_g * 65535)
-        value_b = int(value_b * 65535)
-        pixel_start = pixel_index * self.COLORS_PER_PIXEL
-        buffer_start = (pixel_start + 0) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_b >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_b & 0xFF
-        buffer_start = (pixel_start + 1) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_g >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_g & 0xFF
-        buffer_start = (pixel_start + 2) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_r >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_r & 0xFF
+        # convert to 16bit int directly in the pack call.
+        # buffer channel order is blue, green, red
+        struct.pack_into(
+            ">HHH",
+            self._buffer,
+            pixel_index * _BUFFER_BYTES_PER_PIXEL,
+            int(value_b * 65535) & 0xFFFF,
+            int(value_g * 65535) & 0xFFFF,
+            int(value_r * 65535) & 0xFFFF
+        )
 
     def set_pixel_16bit_color(self, pixel_index, color):
         """
         Set color for pixel.
 
         This is a Fast UNPROTECTED function:
-        no error / range checking is done.
+        no error / range checking is done -
+        out of range values wrap around (only the lower 16bit are used).
         its a little bit slower as `set_pixel_16bit_value`
 
         :param int pixel_index: 0..(pixel_count)
         :param int color: 3-tuple of R, G, B;  0..65535
         """
-        pixel_start = pixel_index * self.COLORS_PER_PIXEL
-        buffer_start = (pixel_start + 0) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (color[2] >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = color[2] & 0xFF
-        buffer_start = (pixel_start + 1) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (color[1] >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = color[1] & 0xFF
-        buffer_start = (pixel_start + 2) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (color[0] >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = color[0] & 0xFF
+        # kept inline - saves the call to set_pixel_16bit_value.
+        # buffer channel order is blue, green, red
+        struct.pack_into(
+            ">HHH",
+            self._buffer,
+            pixel_index * _BUFFER_BYTES_PER_PIXEL,
+            color[2] & 0xFFFF,
+            color[1] & 0xFFFF,
+            color[0] & 0xFFFF
+        )
 
     def set_pixel_float_color(self, pixel_index, color):
         """
         Set color for pixel.
 
         This is a Fast UNPROTECTED function:
-        no error / range checking is done.
+        no error / range checking is done -
+        out of range values wrap around (only the lower 16bit are used).
         its a little bit slower as `set_pixel_16bit_value`
 
         :param int pixel_index: 0..(pixel_count)
         :param tuple/float color: 3-tuple of R, G, B;  0..1
         """
-        # convert to 16bit int
-        value_r = int(color[0] * 65535)
-        value_g = int(color[1] * 65535)
-        value_b = int(color[2] * 65535)
-        # calculate pixel_start
-        pixel_start = pixel_index * self.COLORS_PER_PIXEL
-        # set values
-        buffer_start = (pixel_start + 0) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_b >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_b & 0xFF
-        buffer_start = (pixel_start + 1) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_g >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_g & 0xFF
-        buffer_start = (pixel_start + 2) * self.BUFFER_BYTES_PER_COLOR
-        self._buffer[buffer_start + 0] = (value_r >> 8) & 0xFF
-        self._buffer[buffer_start + 1] = value_r & 0xFF
+        # convert to 16bit int directly in the pack call.
+        # buffer channel order is blue, green, red
+        struct.pack_into(
+            ">HHH",
+            self._buffer,
+            pixel_index * _BUFFER_BYTES_PER_PIXEL,
+            int(color[2] * 65535) & 0xFFFF,
+            int(color[1] * 65535) & 0xFFFF,
+            int(color[0] * 65535) & 0xFFFF
+        )
 
     def set_pixel(self, pixel_index, value):
         """
@@ -1010,27 +1147,20 @@ class TLC5957(object):
         if 0 <= pixel_index < self.pixel_count:
             # print("pixel_index", pixel_index)
             # print("value", value)
-            # convert to list
-            value = list(value)
-            # print("value", value)
-            # print("rep:")
-            # repr(value)
             # print("check length..")
-            if len(value) != self.COLORS_PER_PIXEL:
+            if not isinstance(value, (tuple, list)):
+                # any other iterable (e.g. a generator) -
+                # it may have no len() and no index access.
+                value = tuple(value)
+            if len(value) != _COLORS_PER_PIXEL:
                 raise IndexError(
                     "length of value {} does not match COLORS_PER_PIXEL (= {})"
-                    "".format(len(value), self.COLORS_PER_PIXEL)
+                    "".format(len(value), _COLORS_PER_PIXEL)
                 )
-            # tested:
-            # splitting up into variables to not need the list..
-            # this is about 0.25ms slower..
-            # value_r = value[0]
-            # value_g = value[1]
-            # value_b = value[2]
-
-            # check if we have float values
-            # this modifies 'value' in place..
-            self._check_and_convert(value)
+            # check if we have float values.
+            # this returns a new tuple -
+            # so there is no need to copy value to a list first.
+            value = self._check_and_convert(value)
 
             # print("value", value)
 
@@ -1038,26 +1168,14 @@ class TLC5957(object):
             # print("pixel_index", pixel_index, "value", value)
             # we change channel order here:
             # buffer channel order is blue, green, red
-            pixel_start = pixel_index * self.COLORS_PER_PIXEL
-            # self._set_channel_16bit_value(
-            #     pixel_start + 0,
-            #     value[2])
-            # self._set_channel_16bit_value(
-            #     pixel_start + 1,
-            #     value[1])
-            # self._set_channel_16bit_value(
-            #     pixel_start + 2,
-            #     value[0])
-            # optimize2
-            buffer_start = (pixel_start + 0) * self.BUFFER_BYTES_PER_COLOR
-            self._buffer[buffer_start + 0] = (value[2] >> 8) & 0xFF
-            self._buffer[buffer_start + 1] = value[2] & 0xFF
-            buffer_start = (pixel_start + 1) * self.BUFFER_BYTES_PER_COLOR
-            self._buffer[buffer_start + 0] = (value[1] >> 8) & 0xFF
-            self._buffer[buffer_start + 1] = value[1] & 0xFF
-            buffer_start = (pixel_start + 2) * self.BUFFER_BYTES_PER_COLOR
-            self._buffer[buffer_start + 0] = (value[0] >> 8) & 0xFF
-            self._buffer[buffer_start + 1] = value[0] & 0xFF
+            struct.pack_into(
+                ">HHH",
+                self._buffer,
+                pixel_index * _BUFFER_BYTES_PER_PIXEL,
+                value[2],
+                value[1],
+                value[0]
+            )
         else:
             raise IndexError(
                 "index {} out of range [0..{}]"
@@ -1068,14 +1186,82 @@ class TLC5957(object):
         """
         Set the R, G, B values for all pixels.
 
-        fast. without error checking.
+        fast. without error checking -
+        out of range values wrap around (only the lower 16bit are used).
 
         :param int value_r: 0..65535
         :param int value_g: 0..65535
         :param int value_b: 0..65535
         """
-        for i in range(self.pixel_count):
-            self.set_pixel_16bit_value(i, value_r, value_g, value_b)
+        # pack one pixel once -
+        # buffer channel order is blue, green, red
+        pixel_pattern = struct.pack(
+            ">HHH", value_b & 0xFFFF, value_g & 0xFFFF, value_r & 0xFFFF)
+        # and fill all pixels with one slice assignment (runs in C).
+        buffer_end = self.pixel_count * _BUFFER_BYTES_PER_PIXEL
+        self._buffer[0:buffer_end] = pixel_pattern * self.pixel_count
+
+    def set_pixels_from_array(self, array):
+        """
+        Set the R, G, B values for all pixels from one array.
+
+        made for numpy arrays (for example audio / FFT driven animations
+        on CPython with Blinka):
+        numpy does the reordering to blue, green, red and the conversion
+        to big-endian - so the buffer is written with one slice assignment.
+        numpy is not imported here -
+        any object that implements the used numpy array API works.
+        for per pixel effects (gradients, plasma, ...)
+        calculate the whole frame as array operations
+        and hand the result to this function -
+        this way no python level loop over the pixels is needed.
+        the value range of the whole array is checked
+        with vectorized min / max.
+
+        :param array: numpy array with shape (pixel_count, 3) of R, G, B;
+            float arrays 0..1, all other types int 0..65535
+        """
+        if tuple(array.shape) != (self.pixel_count, _COLORS_PER_PIXEL):
+            raise IndexError(
+                "array shape {} does not match (pixel_count, 3) = ({}, 3)"
+                "".format(tuple(array.shape), self.pixel_count)
+            )
+        array = self._check_and_convert_array(array)
+        # buffer channel order is blue, green, red
+        buffer_end = self.pixel_count * _BUFFER_BYTES_PER_PIXEL
+        self._buffer[0:buffer_end] = array[:, ::-1].astype(">u2").tobytes()
+
+    def set_color_all_16bit_value(self, color_index, value):
+        """
+        Set one color for all pixels - the other colors are kept.
+
+        fast. without value checking -
+        out of range values wrap around (only the lower 16bit are used).
+
+        :param int color_index: 0=R, 1=G, 2=B
+        :param int value: 0..65535
+        """
+        if not 0 <= color_index < _COLORS_PER_PIXEL:
+            raise IndexError(
+                "color_index {} out of range (0..{})".format(
+                    color_index,
+                    _COLORS_PER_PIXEL - 1
+                )
+            )
+        # the buffer stays in the on-wire pixel layout.
+        # CircuitPython memoryview has no step slicing -
+        # so we can not use a strided per color view.
+        # instead write the 16bit word at every pixel stride in place.
+        # buffer channel order is blue, green, red
+        buffer_start = (
+            (_COLORS_PER_PIXEL - 1 - color_index) * _BUFFER_BYTES_PER_COLOR)
+        buffer_end = self.pixel_count * _BUFFER_BYTES_PER_PIXEL
+        buffer = self._buffer
+        pack_into = struct.pack_into
+        value &= 0xFFFF
+        for buffer_index in range(
+                buffer_start, buffer_end, _BUFFER_BYTES_PER_PIXEL):
+            pack_into(">H", buffer, buffer_index, value)
 
     def set_pixel_all(self, color):
         """
@@ -1083,13 +1269,21 @@ class TLC5957(object):
 
         :param tuple 3-tuple of R, G, B;  each int 0..65535 or float 0..1
         """
-        for i in range(self.pixel_count):
-            self.set_pixel(i, color)
+        # check & convert the color only once
+        if len(color) != _COLORS_PER_PIXEL:
+            raise IndexError(
+                "length of value {} does not match COLORS_PER_PIXEL (= {})"
+                "".format(len(color), _COLORS_PER_PIXEL)
+            )
+        value = self._check_and_convert(color)
+        # and use the pattern fill for all pixels
+        self.set_pixel_all_16bit_value(value[0], value[1], value[2])
 
     def set_all_black(self):
         """Set all pixels to black."""
-        for i in range(self.pixel_count):
-            self.set_pixel_16bit_value(i, 0, 0, 0)
+        # one zero filled slice assignment - runs in C.
+        buffer_end = self.pixel_count * _BUFFER_BYTES_PER_PIXEL
+        self._buffer[0:buffer_end] = bytes(buffer_end)
 
     def set_channel(self, channel_index, value):
         """
@@ -1099,24 +1293,27 @@ class TLC5957(object):
         :param int value: 0..65535
         """
         if 0 <= channel_index < (self.channel_count):
-            # check if values are in range
-            if not 0 <= value <= 65535:
+            # check if values are in range -
+            # one mask & compare - same range as 0 <= value <= 65535.
+            # (struct.pack_into can not do this check for us:
+            # CircuitPython truncates out of range values silently.)
+            if (value & 0xFFFF) != value:
                 raise ValueError(
                     "value {} not in range: 0..65535"
+                    "".format(value)
                 )
             # temp = channel_index
             # we change channel order here:
             # buffer channel order is blue, green, red
-            pixel_index_offset = channel_index % self.COLORS_PER_PIXEL
-            if pixel_index_offset == 0:
-                channel_index += 2
-            if pixel_index_offset == 2:
-                channel_index -= 2
+            # swap R & B without branch:
+            # offset 0 → +2; offset 1 → 0; offset 2 → -2
+            channel_index += 2 - 2 * (channel_index % _COLORS_PER_PIXEL)
             # print("{:>2} → {:>2}".format(temp, channel_index))
-            buffer_index = channel_index * self.BUFFER_BYTES_PER_COLOR
-            self._set_16bit_value_in_buffer(buffer_index, value)
-            # self._set_16bit_value_in_buffer(
-            #     self.COLORS_PER_PIXEL - channel_index, value)
+            struct.pack_into(
+                ">H",
+                self._buffer,
+                channel_index * _BUFFER_BYTES_PER_COLOR,
+                value)
         else:
             raise IndexError(
                 "channel_index {} out of range (0..{})".format(
@@ -1137,14 +1334,17 @@ class TLC5957(object):
 
         Each value is a 16-bit number from 0-65535.
         """
-        if 0 < key < self.pixel_count:
-            return (
-                self._get_16bit_value_from_buffer(key + 0),
-                self._get_16bit_value_from_buffer(key + 2),
-                self._get_16bit_value_from_buffer(key + 4)
-            )
+        if 0 <= key < self.pixel_count:
+            # read the whole pixel with one C level call.
+            # buffer channel order is blue, green, red
+            value_b, value_g, value_r = struct.unpack_from(
+                ">HHH", self._buffer, key * _BUFFER_BYTES_PER_PIXEL)
+            return (value_r, value_g, value_b)
         else:
-            raise IndexError
+            raise IndexError(
+                "index {} out of range [0..{}]"
+                "".format(key, self.pixel_count - 1)
+            )
 
     def __setitem__(self, key, value):
         """
@@ -1157,35 +1357,47 @@ class TLC5957(object):
 
         :param int key: 0..(pixel_count)
         :param tuple 3-tuple of R, G, B;  each int 0..65535 or float 0..1
+            or a fancyled CRGB object.
         """
         # for a more detailed version with all the debugging code and
         # comments look at set_pixel
         if 0 <= key < self.pixel_count:
-            # convert to list
-            value = list(value)
-
-            if len(value) != self.COLORS_PER_PIXEL:
-                raise IndexError(
-                    "length of value {} does not match COLORS_PER_PIXEL (= {})"
-                    "".format(len(value), self.COLORS_PER_PIXEL)
-                )
-
-            # this modifies value in place..
-            self._check_and_convert(value)
+            if hasattr(value, "red"):
+                # fancyled CRGB:
+                # read the float attributes directly -
+                # this skips the CRGB.__getitem__ index dispatch.
+                value_r = value.red
+                value_g = value.green
+                value_b = value.blue
+            else:
+                if not isinstance(value, (tuple, list)):
+                    # any other iterable (e.g. a generator) -
+                    # it may have no len() and no index access.
+                    value = tuple(value)
+                if len(value) != _COLORS_PER_PIXEL:
+                    raise IndexError(
+                        "length of value {} does not match "
+                        "COLORS_PER_PIXEL (= {})"
+                        "".format(len(value), _COLORS_PER_PIXEL)
+                    )
+                value_r = value[0]
+                value_g = value[1]
+                value_b = value[2]
 
+            # check & convert every channel in one pass
+            # and write them directly - no temporary list needed.
+            convert = self._check_and_convert_channel
             # update buffer
             # we change channel order here:
             # buffer channel order is blue, green, red
-            pixel_start = key * self.COLORS_PER_PIXEL
-            buffer_start = (pixel_start + 0) * self.BUFFER_BYTES_PER_COLOR
-            self._buffer[buffer_start + 0] = (value[2] >> 8) & 0xFF
-            self._buffer[buffer_start + 1] = value[2] & 0xFF
-            buffer_start = (pixel_start + 1) * self.BUFFER_BYTES_PER_COLOR
-            self._buffer[buffer_start + 0] = (value[1] >> 8) & 0xFF
-            self._buffer[buffer_start + 1] = value[1] & 0xFF
-            buffer_start = (pixel_start + 2) * self.BUFFER_BYTES_PER_COLOR
-            self._buffer[buffer_start + 0] = (value[0] >> 8) & 0xFF
-            self._buffer[buffer_start + 1] = value[0] & 0xFF
+            # all three big-endian words are written with one call.
+            struct.pack_into(
+                ">HHH",
+                self._buffer,
+                key * _BUFFER_BYTES_PER_PIXEL,
+                convert(value_b),
+                convert(value_g),
+                convert(value_r))
         else:
             raise IndexError(
                 "index {} out of range [0..{}]"